@@ -3,31 +3,255 @@ Small Local Business Scraper with Zip Code Search
 Uses DeepSeek R1 14B locally to find and extract small independent service businesses
 """
 
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import csv
+import hashlib
+import socket
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
 import re
 from urllib.parse import quote_plus, urljoin, urlparse
 import ollama
 from datetime import datetime
 
+# Prefer the C-backed lexbor parser, fall back to BeautifulSoup when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
+
+# Optional on-disk cache for model results (skipped when diskcache isn't installed)
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# orjson parses and serializes much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns applied to every scraped page and model response, compiled once
+_MAILTO_RE = re.compile(r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b([a-zA-Z0-9][a-zA-Z0-9._%+-]*@[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,})\b')
+_EMAIL_EXT_RE = re.compile(r'\.(png|jpg|jpeg|gif|svg|webp|pdf|js|css|woff|ttf|ico)')
+_VALID_TLD_RE = re.compile(r'\.(com|net|org|edu|gov|co|us|io|biz|info)$')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_NON_DIGIT_RE = re.compile(r'\D')
+_ADDR_RE = re.compile(r'\d+\s+[A-Z][a-zA-Z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way)\.?')
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_EXCLUDED_RE = re.compile(
+    r'(?:^|\.)(google|facebook|yelp|yellowpages|bbb|angieslist|thumbtack|homeadvisor|linkedin|'
+    r'instagram|twitter|youtube|wikipedia|bing|yahoo|mapquest|tripadvisor|foursquare|nextdoor)\.[a-z]+(?:\.[a-z]{2})?$'
+)
+_BLOB_RE = re.compile(r'<svg[\s\S]*?</svg>|<style[\s\S]*?</style>|data:image/[^"\']+', re.IGNORECASE)
+
+# Up to 2MB of a page is downloaded; after inline blobs are stripped the first 256K characters are parsed
+_MAX_RAW_HTML_BYTES = 2 * 1024 * 1024
+_MAX_HTML_CHARS = 256 * 1024
+
+# Qualification flags the extraction prompt asks the model to fill in
+_QUALIFY_FLAGS = ('is_small_independent', 'is_service_based', 'is_chain_or_franchise')
+
+# Well-known chains and franchises, rejected without asking the model
+_CHAIN_NAMES = frozenset([
+    "roto-rooter", "mr. rooter", "mr. electric", "mr. handyman", "mr. appliance",
+    "benjamin franklin plumbing", "one hour heating", "aire serv",
+    "home depot", "lowe's", "sears home services",
+    "servpro", "servicemaster", "merry maids", "molly maid", "the maids",
+    "terminix", "orkin", "trugreen",
+    "great clips", "supercuts", "sport clips", "fantastic sams",
+    "massage envy", "hand & stone", "ashley furniture", "ikea"
+])
+# Whole-word match so names like "Workin' Man Plumbing" or "Mikea Salon" don't hit "orkin"/"ikea"
+_CHAIN_NAME_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(name) for name in sorted(_CHAIN_NAMES)) + r')\b',
+    re.IGNORECASE
+)
+_CHAIN_DOMAIN_RE = re.compile(
+    r'(?:^|\.)(rotorooter|mrrooter|mrelectric|mrhandyman|mrappliance|benjaminfranklinplumbing|'
+    r'onehourheatandair|aireserv|homedepot|lowes|searshomeservices|servpro|servicemaster|'
+    r'merrymaids|mollymaid|maids|terminix|orkin|trugreen|greatclips|supercuts|sportclips|'
+    r'fantasticsams|massageenvy|handandstone|ashleyfurniture|ikea)\.com$'
+)
+
+# Fixed instruction prompts. They go in the system message and never change
+# between calls, so Ollama can reuse the cached prefix; per-page data goes last.
+_QUALIFY_SYSTEM_PROMPT = """Analyze the business described by the user and determine if it meets ALL these criteria:
+
+MUST BE:
+- Small, independent business (not a chain or franchise)
+- Service-based (provides services, not just selling products)
+- Local trades like: plumbing, HVAC, beauty salons, massage therapists, furniture stores, electricians, carpenters, landscaping, cleaning, pest control, locksmiths, roofing, painting, etc.
+
+MUST NOT BE:
+- Part of a large chain or national franchise
+- Manufacturer or factory
+- Retail store (unless it's a local furniture store with services)
+- Restaurant or food service
+- Medical/dental office
+- Real estate agency
+- Bank or financial institution
+- Directory or listing site
+
+Respond with ONLY a JSON object:
+{
+    "is_small_independent": true/false,
+    "is_service_based": true/false,
+    "is_chain_or_franchise": true/false,
+    "business_type": "brief category like 'plumbing service' or 'beauty salon'",
+    "reasoning": "brief explanation"
+}"""
+
+_EXTRACT_SYSTEM_PROMPT = """Extract business information from the webpage the user provides. Return ONLY valid JSON.
+
+The user message starts with PRE-EXTRACTED CONTACT INFO found on the page, followed by the webpage URL, meta description and page text.
+
+PRIORITY: Phone and email are MOST IMPORTANT. Check footer and header sections carefully.
+
+Required fields (use null if not found):
+- business_name: Company name
+- owner_name: Full name of owner
+- owner_email: Personal email with name (NOT info@/contact@)
+- business_email: Generic business email (info@, contact@, etc.)
+- address: Full street address
+- city: City name
+- state: 2-letter state code
+- zip_code: ZIP code
+- phone: Phone number (USE PRE-EXTRACTED IF AVAILABLE)
+- website: The webpage URL
+- description: Brief description (2-3 sentences)
+- services: Array of services
+- is_small_independent: true/false - small, independent business (not part of a chain or franchise)
+- is_service_based: true/false - provides services, not just selling products
+- is_chain_or_franchise: true/false - part of a large chain or national franchise
+- business_type: Brief category like 'plumbing service' or 'beauty salon'
+- reasoning: Brief explanation of the three true/false answers
+
+QUALIFICATION: We want local trades like plumbing, HVAC, beauty salons, massage therapists, furniture stores, electricians, carpenters, landscaping, cleaning, pest control, locksmiths, roofing, painting, etc.
+Set is_service_based to false for manufacturers/factories, retail stores (unless it's a local furniture store with services), restaurants/food service, medical/dental offices, real estate agencies, banks/financial institutions, and directory or listing sites.
+
+CRITICAL: If phones/emails are pre-extracted, you MUST use them. Do NOT create fake contact info.
+
+Return ONLY JSON, no other text."""
+
+# Columns written to the CSV and Excel output, in order
+_RESULT_FIELDS = ['business_name', 'owner_name', 'owner_email', 'business_email',
+                  'phone', 'address', 'city', 'state', 'zip_code', 'website',
+                  'description', 'services', 'business_type', 'source_url']
+
+# How long cached model results stay valid (30 days)
+_CACHE_EXPIRE = 30 * 24 * 60 * 60
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when available, otherwise the stdlib json module"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize obj as indented JSON without escaping non-ASCII characters"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _parse_model_json(text: str) -> Optional[Dict]:
+    """Parse a model reply as a JSON object, or None if it doesn't contain one"""
+    try:
+        result = _json_loads(text)
+    except ValueError:
+        # Servers that ignore format='json' may wrap the object in other text
+        json_match = _JSON_OBJECT_RE.search(text)
+        if not json_match:
+            return None
+        result = _json_loads(json_match.group())
+
+    return result if isinstance(result, dict) else None
+
+
+def _json_balanced(text: str) -> bool:
+    """Return True once text holds a complete top-level JSON object (braces in strings are ignored)"""
+    # Skip any reasoning trace the model emits before the answer
+    if '<think>' in text:
+        think_end = text.find('</think>')
+        if think_end == -1:
+            return False
+        text = text[think_end + len('</think>'):]
+
+    start = text.find('{')
+    if start == -1:
+        return False
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for char in text[start:]:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return True
+
+    return False
+
 
 class SmallBusinessScraper:
-    def __init__(self, model_name: str = "deepseek-r1:14b"):
+    def __init__(self, model_name: str = "deepseek-r1:14b",
+                 qualifier_model: str = "llama3.2:3b-instruct-q4_K_M",
+                 cache_dir: str = ".llm_cache"):
         """
         Initialize scraper with local DeepSeek model
 
         Args:
-            model_name: Ollama model name (default: deepseek-r1:14b)
+            model_name: Ollama model name used for extraction (default: deepseek-r1:14b)
+            qualifier_model: Smaller Ollama model for the standalone qualification check
+            cache_dir: Directory for cached model results (requires diskcache)
         """
         self.model_name = model_name
+        self.qualifier_model = qualifier_model
+        self.cache = diskcache.Cache(cache_dir) if diskcache is not None else None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
 
+        # Shared connection pool so repeat requests skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Service-based business types we're targeting
         self.service_types = [
             "plumbers", "plumbing services",
@@ -47,22 +271,75 @@ class SmallBusinessScraper:
             "appliance repair"
         ]
 
-        print(f"✓ Initialized with model: {model_name}")
+        print(f"✓ Initialized with model: {model_name} (qualifier: {qualifier_model})")
         self._test_model_connection()
 
-    def _test_model_connection(self):
-        """Test connection to local Ollama model"""
+    def _cache_key(self, model: str, system_prompt: str, *parts: str) -> str:
+        """Build a cache key from the model name, its system prompt and the given parts"""
+        # The prompt is part of the key so editing it invalidates old results
+        return hashlib.sha1('|'.join((model, system_prompt) + parts).encode('utf-8', 'replace')).hexdigest()
+
+    def _cache_get(self, key: str):
+        """Return a cached model result, or None if missing/expired/caching disabled"""
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_set(self, key: str, value):
+        """Store a model result in the cache (no-op when caching is disabled)"""
+        if self.cache is not None:
+            self.cache.set(key, value, expire=_CACHE_EXPIRE)
+
+    def _chat(self, model: str, system_prompt: str, user_content: str, num_ctx: int, num_predict: int) -> str:
+        """
+        Send a fixed system prompt plus per-call data to the model and return its reply
+
+        The model is constrained to JSON output, the reply is streamed, and
+        generation stops as soon as a complete JSON object has arrived.
+        """
+        stream = ollama.chat(
+            model=model,
+            messages=[
+                {'role': 'system', 'content': system_prompt},
+                {'role': 'user', 'content': user_content}
+            ],
+            options={'num_ctx': num_ctx, 'num_predict': num_predict, 'temperature': 0},
+            format='json',
+            think=False,
+            stream=True,
+            keep_alive='1h'
+        )
+
+        result_text = ''
         try:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{'role': 'user', 'content': 'Reply with just: OK'}]
-            )
-            print(f"✓ Model connection successful")
-        except Exception as e:
-            print(f"✗ Error connecting to model: {e}")
-            print(f"  Make sure Ollama is running and model is installed:")
-            print(f"  ollama run {self.model_name}")
-            raise
+            for chunk in stream:
+                result_text += chunk['message']['content']
+                if _json_balanced(result_text):
+                    break
+        finally:
+            # Closing the stream drops the connection, which makes Ollama stop generating
+            stream.close()
+
+        return result_text
+
+    def _test_model_connection(self):
+        """Test connection to local Ollama models and keep them loaded for the run"""
+        # Same call path and num_ctx as the real requests, so an outdated ollama client
+        # (no think= support) fails here and the models don't reload on first use
+        for model, num_ctx in ((self.model_name, 8192), (self.qualifier_model, 4096)):
+            try:
+                self._chat(model, 'Reply with the JSON object {"ok": true}', 'ping',
+                           num_ctx=num_ctx, num_predict=20)
+                print(f"✓ Model connection successful: {model}")
+            except TypeError as e:
+                print(f"✗ Your ollama Python package is too old: {e}")
+                print(f"  Upgrade it with: pip install -U \"ollama>=0.5\"")
+                raise
+            except Exception as e:
+                print(f"✗ Error connecting to model {model}: {e}")
+                print(f"  Make sure Ollama is running and model is installed:")
+                print(f"  ollama pull {model}")
+                raise
 
     def fetch_business_urls_by_zipcode(self, zipcode: str, max_businesses: int = 20) -> List[str]:
         """
@@ -75,36 +352,45 @@ class SmallBusinessScraper:
         Returns:
             List of business website URLs
         """
-        all_urls = set()
+        # One URL per business site, keyed by host - not registrable domain, so separate
+        # sites on shared builders (joes.wixsite.com, amy.square.site) stay separate
+        seen_hosts: Dict[str, str] = {}
 
         print(f"\n{'='*60}")
         print(f"🔍 Searching for service businesses in ZIP code: {zipcode}")
         print(f"{'='*60}\n")
 
-        # Search for multiple business types
-        search_count = 0
-        for service_type in self.service_types:
-            if len(all_urls) >= max_businesses:
-                break
+        # Search for all business types in parallel, keeping results as they arrive
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self._search_google_oxylabs, f"{service_type} near {zipcode}"): service_type
+                for service_type in self.service_types
+            }
 
-            search_count += 1
-            print(f"[{search_count}/{len(self.service_types)}] Searching: {service_type} near {zipcode}")
+            for search_count, future in enumerate(as_completed(futures), 1):
+                print(f"[{search_count}/{len(self.service_types)}] Searched: {futures[future]} near {zipcode}")
 
-            urls = self._search_google_oxylabs(f"{service_type} near {zipcode}")
+                # Results are already filtered to business sites by _search_google_oxylabs
+                for url in future.result():
+                    host = self._site_host(url)
+                    known_url = seen_hosts.get(host)
 
-            for url in urls:
-                if len(all_urls) >= max_businesses:
+                    if known_url is None:
+                        if len(seen_hosts) >= max_businesses:
+                            break
+                        seen_hosts[host] = url
+                        print(f"  ✓ Found: {url}")
+                    elif len(urlparse(url).path) < len(urlparse(known_url).path):
+                        # Same business - prefer the shallower page (usually the home page)
+                        seen_hosts[host] = url
+
+                if len(seen_hosts) >= max_businesses:
+                    # Drop searches that have not started yet
+                    for pending in futures:
+                        pending.cancel()
                     break
 
-                # Filter out non-business sites
-                if self._is_valid_business_url(url):
-                    all_urls.add(url)
-                    print(f"  ✓ Found: {url}")
-
-            # Rate limiting for searches
-            time.sleep(2)
-
-        url_list = list(all_urls)
+        url_list = list(seen_hosts.values())
         print(f"\n✓ Total unique business URLs found: {len(url_list)}")
         return url_list
 
@@ -144,7 +430,7 @@ class SmallBusinessScraper:
             }
 
             # Make request with Basic Auth
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
                 auth=(oxylabs_config['username'], oxylabs_config['password']),
@@ -185,95 +471,87 @@ class SmallBusinessScraper:
             print(f"  ⚠ Unexpected error: {e}")
             return []
 
+    def _site_host(self, url: str) -> str:
+        """Return the URL's host without a leading 'www.' (e.g. 'acmeplumbing.com' for https://www.acmeplumbing.com/contact)"""
+        host = (urlparse(url).hostname or '').lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _prefetch_dns(self, urls: List[str]):
+        """Resolve every URL's host in parallel to warm the OS resolver cache"""
+        def resolve(url: str):
+            parsed = urlparse(url)
+            try:
+                socket.getaddrinfo(parsed.hostname, 443 if parsed.scheme == 'https' else 80,
+                                   type=socket.SOCK_STREAM)
+            except (OSError, UnicodeError, ValueError):
+                # Unresolvable hosts fail again (and get reported) when scraped
+                pass
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(resolve, urls))
+
     def _is_valid_business_url(self, url: str) -> bool:
         """Check if URL is likely a legitimate business website"""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Exclude common non-business sites
-            excluded_domains = [
-                'google.com', 'facebook.com', 'yelp.com', 'yellowpages.com',
-                'bbb.org', 'angieslist.com', 'thumbtack.com', 'homeadvisor.com',
-                'linkedin.com', 'instagram.com', 'twitter.com', 'youtube.com',
-                'wikipedia.org', 'bing.com', 'yahoo.com', 'mapquest.com',
-                'tripadvisor.com', 'foursquare.com', 'nextdoor.com'
-            ]
-
-            for excluded in excluded_domains:
-                if excluded in domain:
-                    return False
-
-            # Must have a proper domain
-            if '.' not in domain:
-                return False
+            domain = (urlparse(url).hostname or '').lower()
+        except ValueError:
+            # Malformed URLs (e.g. broken IPv6 brackets)
+            return False
 
-            return True
+        # Must have a proper domain and not be a directory, social network or search engine
+        return '.' in domain and not _EXCLUDED_RE.search(domain)
 
-        except:
-            return False
+    def _known_chain_reason(self, url: str, business_name: Optional[str] = None) -> Optional[str]:
+        """Return why a business is an obvious chain/franchise, or None if it isn't"""
+        domain = (urlparse(url).hostname or '').lower()
+        if _CHAIN_DOMAIN_RE.search(domain):
+            return f"chain website ({domain})"
+
+        # The model's JSON isn't schema-checked, so the name may not be a string
+        if isinstance(business_name, str):
+            name_match = _CHAIN_NAME_RE.search(business_name)
+            if name_match:
+                return f"known chain/franchise name ({name_match.group().lower()})"
+
+        return None
 
     def is_small_independent_business(self, business_data: Dict) -> bool:
         """
-        Use DeepSeek to determine if business is small, independent, and service-based
+        Use the qualifier model to determine if business is small, independent, and service-based
         Excludes chains, franchises, manufacturers, and retail stores
-        """
-        prompt = f"""Analyze this business and determine if it meets ALL these criteria:
-
-MUST BE:
-- Small, independent business (not a chain or franchise)
-- Service-based (provides services, not just selling products)
-- Local trades like: plumbing, HVAC, beauty salons, massage therapists, furniture stores, electricians, carpenters, landscaping, cleaning, pest control, locksmiths, roofing, painting, etc.
-
-MUST NOT BE:
-- Part of a large chain or national franchise
-- Manufacturer or factory
-- Retail store (unless it's a local furniture store with services)
-- Restaurant or food service
-- Medical/dental office
-- Real estate agency
-- Bank or financial institution
-- Directory or listing site
 
-Business Information:
+        The extraction prompt already asks for the qualification flags, so a
+        separate model call is only made when they are missing from business_data.
+        """
+        if all(business_data.get(flag) is not None for flag in _QUALIFY_FLAGS):
+            return self._report_qualification(business_data)
+
+        website = business_data.get('website') or business_data.get('source_url') or ''
+        cache_key = self._cache_key(
+            self.qualifier_model,
+            _QUALIFY_SYSTEM_PROMPT,
+            str(business_data.get('business_name') or ''),
+            str(business_data.get('description') or '')[:500],
+            urlparse(website).netloc
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print(f"  ✓ Using cached verdict: {'qualified' if cached else 'filtered out'}")
+            return cached
+
+        business_block = f"""Business Information:
 Name: {business_data.get('business_name', 'Unknown')}
 Description: {business_data.get('description', 'N/A')}
-Website: {business_data.get('website', 'N/A')}
-
-Respond with ONLY a JSON object:
-{{
-    "is_small_independent": true/false,
-    "is_service_based": true/false,
-    "is_chain_or_franchise": true/false,
-    "business_type": "brief category like 'plumbing service' or 'beauty salon'",
-    "reasoning": "brief explanation"
-}}"""
+Website: {business_data.get('website', 'N/A')}"""
 
         try:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{'role': 'user', 'content': prompt}]
-            )
+            result_text = self._chat(self.qualifier_model, _QUALIFY_SYSTEM_PROMPT, business_block, num_ctx=4096, num_predict=400)
 
-            result_text = response['message']['content']
-
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
-
-                # Must be small independent AND service-based AND NOT a chain
-                is_qualified = (
-                    analysis.get('is_small_independent', False) and
-                    analysis.get('is_service_based', False) and
-                    not analysis.get('is_chain_or_franchise', True)
-                )
-
-                if is_qualified:
-                    print(f"  ✓ Qualified: {analysis.get('business_type', 'service business')}")
-                else:
-                    print(f"  ✗ Filtered out: {analysis.get('reasoning', 'Does not meet criteria')}")
+            analysis = _parse_model_json(result_text)
+            if analysis is not None:
+                is_qualified = self._report_qualification(analysis)
 
+                self._cache_set(cache_key, is_qualified)
                 return is_qualified
             else:
                 return False
@@ -282,37 +560,92 @@ Respond with ONLY a JSON object:
             print(f"  ⚠ Error analyzing business: {e}")
             return False
 
-    def scrape_business_page(self, url: str) -> Optional[str]:
-        """Scrape a business webpage and return raw HTML content"""
+    def _report_qualification(self, analysis: Dict) -> bool:
+        """Decide and print whether the model's qualification flags pass"""
+        # Must be small independent AND service-based AND NOT a chain
+        is_qualified = bool(
+            analysis.get('is_small_independent', False) and
+            analysis.get('is_service_based', False) and
+            not analysis.get('is_chain_or_franchise', True)
+        )
+
+        if is_qualified:
+            print(f"  ✓ Qualified: {analysis.get('business_type') or 'service business'}")
+        else:
+            print(f"  ✗ Filtered out: {analysis.get('reasoning') or 'Does not meet criteria'}")
+
+        return is_qualified
+
+    async def scrape_business_page(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Scrape a business webpage and return its HTML without inline blobs (first 256K characters only)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            return response.text
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+
+                # Stop reading once the raw cap is reached instead of downloading bloated pages in full
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if len(body) >= _MAX_RAW_HTML_BYTES:
+                        break
+
+                del body[_MAX_RAW_HTML_BYTES:]
+                try:
+                    html = body.decode(response.charset or 'utf-8', errors='replace')
+                except LookupError:
+                    # Server declared a charset Python doesn't know
+                    html = body.decode('utf-8', errors='replace')
         except Exception as e:
-            print(f"  ✗ Error scraping: {e}")
+            print(f"  ✗ Error scraping {url}: {e}")
             return None
 
-    def extract_business_info(self, html_content: str, url: str) -> Dict:
-        """Use DeepSeek to extract structured business information from HTML"""
+        # Drop inline SVGs, stylesheets and base64 images before capping, so the
+        # budget goes to real content and the footer (contact details) survives
+        return _BLOB_RE.sub('', html)[:_MAX_HTML_CHARS]
+
+    def _parse_page(self, html_content: str) -> Tuple[str, str]:
+        """Return the visible page text (without scripts/styles) and the meta description"""
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html_content)
+            for tag in tree.css('script, style'):
+                tag.decompose()
+
+            # Whole document like the BeautifulSoup path, so the <title> is kept
+            text = tree.root.text(separator='\n', strip=True) if tree.root else ''
+            meta_desc = tree.css_first('meta[name="description"]')
+            description = (meta_desc.attributes.get('content') or '') if meta_desc else ''
+            return text, description
+
         soup = BeautifulSoup(html_content, 'html.parser')
+        for script in soup(["script", "style"]):
+            script.decompose()
 
-        # Extract emails - prioritize mailto: links first (most reliable)
-        mailto_pattern = r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        mailto_emails = re.findall(mailto_pattern, html_content, re.IGNORECASE)
+        text = soup.get_text(separator='\n', strip=True)
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        description = meta_desc.get('content', '') if meta_desc else ''
+        return text, description
 
-        # Then look for plain text emails
-        email_pattern = r'\b([a-zA-Z0-9][a-zA-Z0-9._%+-]*@[a-zA-Z0-9][a-zA-Z0-9.-]*\.[a-zA-Z]{2,})\b'
-        text_emails = re.findall(email_pattern, soup.get_text())
+    def extract_business_info(self, html_content: str, url: str) -> Dict:
+        """Use DeepSeek to extract structured business information from HTML"""
+        cache_key = self._cache_key(self.model_name, _EXTRACT_SYSTEM_PROMPT, url, html_content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print(f"  ✓ Using cached extraction")
+            return cached
+
+        # Get clean text (no scripts/styles) and meta description
+        text, description = self._parse_page(html_content)
+        text = '\n'.join(line for line in text.split('\n') if line.strip())
 
-        # Combine and filter out invalid ones
-        all_emails = mailto_emails + text_emails
-        valid_emails = []
+        # Extract emails - mailto: links from the raw HTML, plain emails from the visible text only,
+        # so script bodies (Sentry DSNs, analytics JSON) can't leak in as contact info
+        all_emails = {email.lower().strip() for email in _MAILTO_RE.findall(html_content)}
+        all_emails.update(email.lower().strip() for email in _EMAIL_RE.findall(text))
+        valid_emails = set()
 
         for email in all_emails:
-            email = email.lower().strip()
-
             # Skip if it contains file extensions or image patterns
-            if re.search(r'\.(png|jpg|jpeg|gif|svg|webp|pdf|js|css|woff|ttf|ico)', email):
+            if _EMAIL_EXT_RE.search(email):
                 continue
             if '@2x' in email or '@3x' in email:
                 continue
@@ -332,34 +665,25 @@ Respond with ONLY a JSON object:
                 continue
 
             # Must end with common valid TLD
-            valid_tlds = ['com', 'net', 'org', 'edu', 'gov', 'co', 'us', 'io', 'biz', 'info']
-            if not any(domain.endswith('.' + tld) for tld in valid_tlds):
+            if not _VALID_TLD_RE.search(domain):
                 continue
 
-            valid_emails.append(email)
+            valid_emails.add(email)
 
-        unique_emails = list(set(valid_emails))
+        unique_emails = list(valid_emails)
 
         # Separate owner vs business emails
         owner_emails = [e for e in unique_emails if not any(prefix in e for prefix in ['info@', 'contact@', 'sales@', 'support@', 'hello@', 'admin@', 'service@', 'office@'])]
         business_emails = [e for e in unique_emails if any(prefix in e for prefix in ['info@', 'contact@', 'sales@', 'support@', 'hello@', 'admin@', 'service@', 'office@'])]
 
         # Extract phone numbers from entire HTML
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',
-            r'\(\d{3}\)\s?\d{3}-\d{4}',
-        ]
-
-        phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, html_content))
+        phones = _PHONE_RE.findall(html_content)
 
         # Clean, validate and format phones
         cleaned_phones = []
         for phone in phones:
             # Remove all non-digit characters to validate
-            digits_only = re.sub(r'\D', '', phone)
+            digits_only = _NON_DIGIT_RE.sub('', phone)
 
             # Must be exactly 10 digits for valid US phone
             if len(digits_only) == 10:
@@ -371,75 +695,30 @@ Respond with ONLY a JSON object:
         main_phone = cleaned_phones[0] if cleaned_phones else None
 
         # Extract address patterns
-        address_pattern = r'\d+\s+[A-Z][a-zA-Z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way)\.?'
-        addresses = re.findall(address_pattern, soup.get_text())
+        addresses = _ADDR_RE.findall(text)
         main_address = addresses[0] if addresses else None
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Get clean text
-        text = soup.get_text(separator='\n', strip=True)
-        text = '\n'.join(line for line in text.split('\n') if line.strip())
         text = text[:12000]
 
-        # Get meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc.get('content', '') if meta_desc else ''
-
-        # Create contact hints for the AI
-        contact_hints = f"""
-PRE-EXTRACTED CONTACT INFO (USE THESE):
+        # Per-page data only - the instructions live in the fixed system prompt
+        page_block = f"""PRE-EXTRACTED CONTACT INFO (USE THESE):
 - Emails: {', '.join(unique_emails[:10]) if unique_emails else 'None'}
-- Owner emails: {', '.join(owner_emails[:5]) if owner_emails else 'None'}  
+- Owner emails: {', '.join(owner_emails[:5]) if owner_emails else 'None'}
 - Business emails: {', '.join(business_emails[:5]) if business_emails else 'None'}
 - Phones: {', '.join(cleaned_phones[:3]) if cleaned_phones else 'None'}
 - Address: {main_address if main_address else 'None'}
-"""
-
-        prompt = f"""Extract business information from this webpage. Return ONLY valid JSON.
-
-{contact_hints}
-
-PRIORITY: Phone and email are MOST IMPORTANT. Check footer and header sections carefully.
-
-Required fields (use null if not found):
-- business_name: Company name
-- owner_name: Full name of owner
-- owner_email: Personal email with name (NOT info@/contact@)
-- business_email: Generic business email (info@, contact@, etc.)
-- address: Full street address
-- city: City name
-- state: 2-letter state code
-- zip_code: ZIP code
-- phone: Phone number (USE PRE-EXTRACTED IF AVAILABLE)
-- website: {url}
-- description: Brief description (2-3 sentences)
-- services: Array of services
-
-CRITICAL: If phones/emails are listed above, you MUST use them. Do NOT create fake contact info.
 
 Webpage URL: {url}
 Meta: {description}
 
 Text:
-{text}
-
-Return ONLY JSON, no other text."""
+{text}"""
 
         try:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{'role': 'user', 'content': prompt}]
-            )
+            result_text = self._chat(self.model_name, _EXTRACT_SYSTEM_PROMPT, page_block, num_ctx=8192, num_predict=1024)
 
-            result_text = response['message']['content']
-
-            # Extract JSON
-            json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                business_data = json.loads(json_match.group())
+            business_data = _parse_model_json(result_text)
+            if business_data is not None:
                 business_data['source_url'] = url
 
                 # Fill in pre-extracted data if model missed it
@@ -452,6 +731,7 @@ Return ONLY JSON, no other text."""
                 if not business_data.get('address') and main_address:
                     business_data['address'] = main_address
 
+                self._cache_set(cache_key, business_data)
                 return business_data
             else:
                 print(f"  ⚠ Could not parse JSON from model response")
@@ -473,48 +753,88 @@ Return ONLY JSON, no other text."""
                 'address': main_address
             }
 
-    def scrape_businesses(self, urls: List[str]) -> List[Dict]:
+    async def scrape_businesses(self, urls: List[str], max_concurrency: int = 16) -> List[Dict]:
         """
         Main method to scrape and filter businesses
 
+        Pages are fetched concurrently (bounded by max_concurrency) while the
+        local model works through the already-downloaded pages one at a time.
+
         Args:
             urls: List of business website URLs to scrape
+            max_concurrency: Maximum number of pages fetched at the same time
 
         Returns:
             List of qualified small independent service businesses
         """
-        qualified_businesses = []
-
         print(f"\n{'='*60}")
         print(f"Starting scrape of {len(urls)} businesses")
         print(f"{'='*60}\n")
 
-        for idx, url in enumerate(urls, 1):
-            print(f"\n[{idx}/{len(urls)}] Processing: {url}")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        llm_lock = asyncio.Lock()
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            results = await asyncio.gather(*[
+                self._process(semaphore, llm_lock, session, url, idx, len(urls))
+                for idx, url in enumerate(urls, 1)
+            ])
+
+        return [business for business in results if business]
+
+    def scrape_businesses_sync(self, urls: List[str], max_concurrency: int = 16) -> List[Dict]:
+        """Blocking wrapper around scrape_businesses()"""
+        return asyncio.run(self.scrape_businesses(urls, max_concurrency))
+
+    async def _process(self, semaphore: asyncio.Semaphore, llm_lock: asyncio.Lock,
+                       session: aiohttp.ClientSession, url: str, idx: int, total: int) -> Optional[Dict]:
+        """Fetch one business page, then hand it to the model once it is free"""
+        # A failure on one page must not abort the gather and lose every other result
+        try:
+            # Obvious chain sites aren't worth a download or a model call
+            chain_reason = self._known_chain_reason(url)
+            if chain_reason:
+                print(f"\n[{idx}/{total}] Skipping {url}: {chain_reason}")
+                return None
+
+            async with semaphore:
+                html = await self.scrape_business_page(session, url)
 
-            # Scrape the page
-            html = self.scrape_business_page(url)
             if not html:
-                continue
+                return None
+
+            # The local model handles one page at a time; other fetches keep running meanwhile
+            async with llm_lock:
+                return await asyncio.to_thread(self._analyze_business, html, url, idx, total)
+        except Exception as e:
+            print(f"  ✗ Error processing {url}: {e}")
+            return None
 
-            # Extract business information
-            print(f"  Extracting business info...")
-            business_data = self.extract_business_info(html, url)
+    def _analyze_business(self, html: str, url: str, idx: int, total: int) -> Optional[Dict]:
+        """Extract and qualify a single scraped business page"""
+        print(f"\n[{idx}/{total}] Processing: {url}")
 
-            if not business_data.get('business_name'):
-                print(f"  ✗ Could not extract business name, skipping")
-                continue
+        # Extract business information
+        print(f"  Extracting business info...")
+        business_data = self.extract_business_info(html, url)
+
+        if not business_data.get('business_name'):
+            print(f"  ✗ Could not extract business name, skipping")
+            return None
 
-            # Check if it's a qualified small independent service business
-            print(f"  Analyzing if qualified small business...")
-            if self.is_small_independent_business(business_data):
-                qualified_businesses.append(business_data)
-                print(f"  ✓ Added to results")
+        chain_reason = self._known_chain_reason(url, business_data['business_name'])
+        if chain_reason:
+            print(f"  ✗ Filtered out: {chain_reason}")
+            return None
 
-            # Rate limiting - be respectful
-            time.sleep(3)
+        # Check if it's a qualified small independent service business
+        print(f"  Analyzing if qualified small business...")
+        if self.is_small_independent_business(business_data):
+            print(f"  ✓ Added to results")
+            return business_data
 
-        return qualified_businesses
+        return None
 
     def save_results(self, businesses: List[Dict], zipcode: str):
         """Save qualified businesses to multiple file formats"""
@@ -531,92 +851,62 @@ Return ONLY JSON, no other text."""
         }
 
         with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+            f.write(_json_dumps(output))
 
         # 2. Save as CSV
         csv_filename = f"{base_filename}.csv"
         if businesses:
-            # Get all possible keys from all businesses
-            all_keys = set()
-            for biz in businesses:
-                all_keys.update(biz.keys())
-
-            # Convert services list to string for CSV
-            csv_businesses = []
-            for biz in businesses:
-                biz_copy = biz.copy()
-                if 'services' in biz_copy and isinstance(biz_copy['services'], list):
-                    biz_copy['services'] = ', '.join(biz_copy['services'])
-                csv_businesses.append(biz_copy)
-
-            fieldnames = ['business_name', 'owner_name', 'owner_email', 'business_email',
-                         'phone', 'address', 'city', 'state', 'zip_code', 'website',
-                         'description', 'services', 'business_type', 'source_url']
-
             with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(csv_businesses)
+                writer = csv.writer(f)
+                writer.writerow(_RESULT_FIELDS)
+                writer.writerows(self._result_row(biz) for biz in businesses)
 
         # 3. Try to save as Excel (optional - requires openpyxl)
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
+            from openpyxl.utils import get_column_letter
 
             xlsx_filename = f"{base_filename}.xlsx"
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = f"Businesses {zipcode}"
+            # Write-only mode streams rows to disk without building cell objects
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet(f"Businesses {zipcode}")
 
             # Headers
             headers = ['Business Name', 'Owner Name', 'Owner Email', 'Business Email',
                       'Phone', 'Address', 'City', 'State', 'ZIP', 'Website',
                       'Description', 'Services', 'Type', 'Source URL']
 
+            # Track column widths while building the rows, in a single pass
+            col_widths = [len(header) for header in headers]
+            rows = []
+            for biz in businesses:
+                row = self._result_row(biz)
+                for col, value in enumerate(row):
+                    if value is not None:
+                        col_widths[col] = max(col_widths[col], len(str(value)))
+                rows.append(row)
+
+            # Auto-adjust column widths (write-only sheets need them before any row is written)
+            for col, width in enumerate(col_widths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(width + 2, 50)
+
             # Style headers
             header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
             header_font = Font(bold=True, color="FFFFFF")
 
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.fill = header_fill
                 cell.font = header_font
+                header_cells.append(cell)
+            ws.append(header_cells)
 
             # Add data
-            for row, biz in enumerate(businesses, 2):
-                ws.cell(row=row, column=1, value=biz.get('business_name'))
-                ws.cell(row=row, column=2, value=biz.get('owner_name'))
-                ws.cell(row=row, column=3, value=biz.get('owner_email'))
-                ws.cell(row=row, column=4, value=biz.get('business_email'))
-                ws.cell(row=row, column=5, value=biz.get('phone'))
-                ws.cell(row=row, column=6, value=biz.get('address'))
-                ws.cell(row=row, column=7, value=biz.get('city'))
-                ws.cell(row=row, column=8, value=biz.get('state'))
-                ws.cell(row=row, column=9, value=biz.get('zip_code'))
-                ws.cell(row=row, column=10, value=biz.get('website'))
-                ws.cell(row=row, column=11, value=biz.get('description'))
-
-                services = biz.get('services', [])
-                if isinstance(services, list):
-                    ws.cell(row=row, column=12, value=', '.join(services))
-                else:
-                    ws.cell(row=row, column=12, value=services)
-
-                ws.cell(row=row, column=13, value=biz.get('business_type'))
-                ws.cell(row=row, column=14, value=biz.get('source_url'))
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            for row in rows:
+                ws.append(row)
 
             wb.save(xlsx_filename)
 
@@ -636,6 +926,17 @@ Return ONLY JSON, no other text."""
             print(f"  pip install openpyxl")
             print(f"{'='*60}")
 
+    def _result_row(self, biz: Dict) -> List:
+        """Project a business record onto the CSV/Excel columns"""
+        row = [biz.get(field) for field in _RESULT_FIELDS]
+
+        # Flatten the services list into a single cell
+        services_idx = _RESULT_FIELDS.index('services')
+        if isinstance(row[services_idx], list):
+            row[services_idx] = ', '.join(row[services_idx])
+
+        return row
+
     def print_summary(self, businesses: List[Dict]):
         """Print a summary of scraped businesses"""
         print(f"\n{'='*60}")
@@ -666,30 +967,38 @@ Return ONLY JSON, no other text."""
             print(f"✗ Invalid zip code: {zipcode}. Please use 5-digit format (e.g., '98052')")
             return
 
-        # Step 1: Fetch business URLs
-        urls = self.fetch_business_urls_by_zipcode(zipcode, max_businesses)
+        try:
+            # Step 1: Fetch business URLs
+            urls = self.fetch_business_urls_by_zipcode(zipcode, max_businesses)
 
-        if not urls:
-            print("\n✗ No business URLs found. Try a different zip code or check your internet connection.")
-            return
+            if not urls:
+                print("\n✗ No business URLs found. Try a different zip code or check your internet connection.")
+                return
 
-        # Step 2: Scrape and filter businesses
-        qualified_businesses = self.scrape_businesses(urls)
+            # Resolve all hosts up front so the page fetches don't wait on DNS
+            self._prefetch_dns(urls)
 
-        # Step 3: Save results
-        if qualified_businesses:
-            self.save_results(qualified_businesses, zipcode)
-            self.print_summary(qualified_businesses)
-        else:
-            print("\n⚠ No qualified small independent service businesses found.")
+            # Step 2: Scrape and filter businesses
+            qualified_businesses = self.scrape_businesses_sync(urls)
+
+            # Step 3: Save results
+            if qualified_businesses:
+                self.save_results(qualified_businesses, zipcode)
+                self.print_summary(qualified_businesses)
+            else:
+                print("\n⚠ No qualified small independent service businesses found.")
+        finally:
+            self.session.close()
+            if self.cache is not None:
+                self.cache.close()
 
 
 def main():
     """Main entry point - Configure Oxylabs and enter zip code!"""
 
-    # Initialize scraper with DeepSeek R1 14B
+    # Initialize scraper with DeepSeek R1 14B (small Llama 3.2 3B for qualification fallback)
     print("Initializing Small Business Scraper with Oxylabs...")
-    scraper = SmallBusinessScraper(model_name="deepseek-r1:14b")
+    scraper = SmallBusinessScraper(model_name="deepseek-r1:14b", qualifier_model="llama3.2:3b-instruct-q4_K_M")
 
     # ===== SETUP INSTRUCTIONS =====
     print("\n" + "="*60)
@@ -697,7 +1006,7 @@ def main():
     print("="*60)
     print("1. Sign up at https://oxylabs.io")
     print("2. Get your username and password from the dashboard")
-    print("3. Edit _search_google_oxylabs() method (around line 135)")
+    print("3. Edit oxylabs_config in the _search_google_oxylabs() method")
     print("4. Replace 'YOUR_OXYLABS_USERNAME' and 'YOUR_OXYLABS_PASSWORD'")
     print("5. Set your ZIP code below and run the script")
     print("="*60 + "\n")